@@ -93,7 +93,8 @@ class OpenAIAnswerService(BaseAIService):
             prompt = self._create_analysis_prompt(question_text)
 
             # Make API call
-            response = await self._call_openai_api(base64_image, prompt)
+            mime_type = "image/webp" if image_path.lower().endswith(".webp") else "image/png"
+            response = await self._call_openai_api(base64_image, prompt, mime_type)
 
             # Parse response
             suggestion = self._parse_response(response, time.time() - start_time)
@@ -183,12 +184,13 @@ Guidelines:
 
         return base_prompt
 
-    async def _call_openai_api(self, base64_image: str, prompt: str) -> dict:
+    async def _call_openai_api(self, base64_image: str, prompt: str, mime_type: str = "image/png") -> dict:
         """Make the API call to OpenAI.
 
         Args:
             base64_image: Base64 encoded image
             prompt: Analysis prompt
+            mime_type: MIME type of the encoded image
 
         Returns:
             API response dictionary
@@ -211,7 +213,7 @@ Guidelines:
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/png;base64,{base64_image}",
+                                        "url": f"data:{mime_type};base64,{base64_image}",
                                         "detail": "high"
                                     }
                                 }
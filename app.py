@@ -25,12 +25,6 @@ from typing import Optional
 
 # Import our refactored modules
 from config import load_config, setup_logging, print_startup_banner, ConfigValidationError
-from notifications import EmailNotificationService
-from monitoring import QuestionMonitor
-from utils import setup_chrome_driver, safe_quit_driver
-from ai_services import OpenAIAnswerService
-from class_functions import select_class_by_name, select_class_interactive, wait_for_button
-from school_logins.purdue_login import purdue_login
 
 
 def main(
@@ -65,6 +59,15 @@ def main(
         ConfigValidationError: If configuration is invalid
         SystemExit: If critical errors occur during execution
     """
+    # Browser, monitoring and service modules pull in selenium; import them
+    # here so --help, --version and argument validation stay fast
+    from notifications import EmailNotificationService
+    from monitoring import QuestionMonitor
+    from utils import get_or_create_driver, safe_quit_driver, set_asset_blocking
+    from ai_services import OpenAIAnswerService
+    from class_functions import select_class_by_name, select_class_interactive, wait_for_button
+    from school_logins.purdue_login import purdue_login
+
     # Load and validate configuration
     try:
         config = load_config(
@@ -133,7 +136,7 @@ def main(
     driver = None
     try:
         logger.info("Initializing Chrome WebDriver")
-        driver = setup_chrome_driver(headless=config.headless)
+        driver = get_or_create_driver(headless=config.headless)
 
         # Execute Purdue login flow
         logger.info("Starting Purdue login flow")
@@ -143,6 +146,10 @@ def main(
             print(f"\n🎉 SUCCESS! Your iClicker access code is: {access_code}")
             logger.info(f"iClicker access code retrieved: {access_code}")
 
+            # Sign-in is done; lift asset blocking before the class page can
+            # show a poll, since blocked slide images are never re-fetched
+            set_asset_blocking(driver, False)
+
             # Handle class selection
             print("\n🎯 CLASS SELECTION")
             class_selected = False
@@ -180,7 +187,10 @@ def main(
                 )
 
                 # Start monitoring (this will run until interrupted)
-                question_monitor.start_monitoring()
+                try:
+                    question_monitor.start_monitoring()
+                finally:
+                    question_monitor.close()
 
             else:
                 logger.warning("Failed to join class session")
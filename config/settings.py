@@ -4,11 +4,17 @@ This module handles loading and validation of application configuration
 from environment variables and command-line arguments.
 """
 
+import io
 import os
-from dataclasses import dataclass
-from typing import Optional
-from dotenv import load_dotenv
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple, cast
 import logging
+import logging.handlers
+
+
+# Set once setup_logging has attached its handlers to the root logger
+_LOGGING_INITIALIZED = False
 
 
 @dataclass
@@ -60,6 +66,11 @@ class AppConfig:
     ai_model: str = "gpt-4o"
     debug_mode: bool = False
 
+    # Pre-formatted summary lines, built once after validation
+    _summary_lines: Tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Validate configuration after initialization.
 
@@ -70,6 +81,7 @@ class AppConfig:
         self._validate_email_config()
         self._validate_ai_config()
         self._validate_polling_interval()
+        self._summary_lines = self._build_summary_lines()
 
     def _validate_required_fields(self) -> None:
         """Validate that required configuration fields are present.
@@ -158,26 +170,38 @@ class AppConfig:
         """
         logger = logging.getLogger(__name__)
 
-        logger.info("=== iClicker Evade Configuration ===")
-        logger.info(f"Username: {self.iclicker_username}")
-        logger.info(f"Class: {self.class_name or 'Interactive selection'}")
-        logger.info(f"Browser mode: {'Headless' if self.headless else 'Visible'}")
-        logger.info(f"Polling interval: {self.polling_interval} seconds")
+        for line in self._summary_lines:
+            logger.info(line)
+
+    def _build_summary_lines(self) -> Tuple[str, ...]:
+        """Format the configuration summary lines logged at startup.
+
+        Returns:
+            Tuple of summary lines with sensitive values masked
+        """
+        lines = [
+            "=== iClicker Evade Configuration ===",
+            f"Username: {self.iclicker_username}",
+            f"Class: {self.class_name or 'Interactive selection'}",
+            f"Browser mode: {'Headless' if self.headless else 'Visible'}",
+            f"Polling interval: {self.polling_interval} seconds",
+        ]
 
         if self.email_enabled:
             # Mask email addresses for privacy
             masked_sender = self._mask_email(self.gmail_sender_email)
             masked_recipient = self._mask_email(self.notification_email)
-            logger.info(f"Email notifications: {masked_recipient} (from {masked_sender})")
+            lines.append(f"Email notifications: {masked_recipient} (from {masked_sender})")
         else:
-            logger.info("Email notifications: Disabled")
+            lines.append("Email notifications: Disabled")
 
         if self.ai_enabled:
-            logger.info(f"AI answer suggestions: Enabled (model: {self.ai_model})")
+            lines.append(f"AI answer suggestions: Enabled (model: {self.ai_model})")
         else:
-            logger.info("AI answer suggestions: Disabled")
+            lines.append("AI answer suggestions: Disabled")
 
-        logger.info(f"Debug mode: {self.debug_mode}")
+        lines.append(f"Debug mode: {self.debug_mode}")
+        return tuple(lines)
 
     def _mask_email(self, email: Optional[str]) -> str:
         """Mask an email address for logging.
@@ -191,20 +215,104 @@ class AppConfig:
         if not email:
             return "None"
 
-        try:
-            local, domain = email.split('@', 1)
-            if len(local) <= 2:
-                masked_local = local
-            else:
-                masked_local = local[0] + '*' * (len(local) - 2) + local[-1]
-            return f"{masked_local}@{domain}"
-        except ValueError:
+        if '@' not in email:
             return "invalid@email.com"
 
+        local, _, domain = email.partition('@')
+        if len(local) <= 2:
+            masked_local = local
+        else:
+            masked_local = local[0] + '*' * (len(local) - 2) + local[-1]
+        return f"{masked_local}@{domain}"
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the ``asctime`` seconds part once per second.
+
+    Records emitted within the same second reuse the cached strftime
+    result, so only the millisecond suffix is formatted per record.
+    """
+
+    def __init__(self, fmt: Optional[str] = None) -> None:
+        super().__init__(fmt)
+        self._cached_second: Optional[int] = None
+        self._cached_time = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record creation time, reusing the per-second prefix."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(
+                self.default_time_format, self.converter(record.created)
+            )
+            self._cached_second = second
+        if self.default_msec_format:
+            return self.default_msec_format % (self._cached_time, record.msecs)
+        return self._cached_time
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that buffers writes below WARNING level.
+
+    The log file is opened with a large write buffer and only flushed
+    after WARNING+ records (and on close), instead of after every record.
+    The rollover check uses a byte count kept in memory, since the base
+    class seeks the stream on every record, which flushes the buffer.
+    """
+
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._flush_pending = True
+        self._bytes_written = 0
+        self._pending_size = 0
+        super().__init__(*args, **kwargs)
+
+    def _open(self) -> io.TextIOWrapper:
+        """Open the log file with a larger write buffer."""
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+        # The mode is always a text mode here, so the stream is a TextIOWrapper
+        return cast(io.TextIOWrapper, open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=getattr(self, 'errors', None),
+        ))
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Decide on rollover from the tracked file size, without seeking."""
+        if self.stream is None:
+            self.stream = self._open()
+        self._pending_size = len((self.format(record) + self.terminator).encode('utf-8', 'replace'))
+        return 0 < self.maxBytes <= self._bytes_written + self._pending_size
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing only for WARNING and above."""
+        self._flush_pending = record.levelno >= logging.WARNING
+        super().emit(record)
+        self._bytes_written += self._pending_size
+
+    def flush(self) -> None:
+        """Flush the stream if the last record requires it."""
+        if self._flush_pending:
+            super().flush()
+
+    def close(self) -> None:
+        """Flush any buffered records and close the file."""
+        self._flush_pending = True
+        super().close()
+
 
 class ConfigValidationError(Exception):
     """Exception raised when configuration validation fails."""
-    pass
+    __slots__ = ()
 
 
 def load_config(
@@ -246,7 +354,11 @@ def load_config(
         >>> print(f"Username: {config.iclicker_username}")
         Username: john_doe
     """
-    # Load environment variables from .env file
+    # Load environment variables from .env file (imported lazily to keep
+    # module import cheap). Existing variables are not overridden, and
+    # optional settings may live only in .env even when credentials are
+    # exported by the shell, so this always runs
+    from dotenv import load_dotenv
     load_dotenv()
 
     try:
@@ -291,15 +403,23 @@ def setup_logging(debug_mode: bool = False) -> None:
     """Set up application logging.
 
     Configures logging with appropriate levels and formatters for both
-    console and file output.
+    console and file output. Handlers are only attached on the first call;
+    subsequent calls just update the log level.
 
     Args:
         debug_mode: If True, set DEBUG level; otherwise INFO level
     """
+    global _LOGGING_INITIALIZED
+
     log_level = logging.DEBUG if debug_mode else logging.INFO
+    root_logger = logging.getLogger()
+
+    if _LOGGING_INITIALIZED:
+        root_logger.setLevel(log_level)
+        return
 
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
@@ -308,13 +428,14 @@ def setup_logging(debug_mode: bool = False) -> None:
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
 
-    # Set up file handler
-    file_handler = logging.FileHandler('iclicker_evade.log')
+    # Set up rotating, buffered file handler (opened lazily on first record)
+    file_handler = _BufferedRotatingFileHandler(
+        'iclicker_evade.log', maxBytes=5_000_000, backupCount=3, delay=True
+    )
     file_handler.setLevel(logging.INFO)  # Always log INFO+ to file
     file_handler.setFormatter(formatter)
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     root_logger.addHandler(console_handler)
     root_logger.addHandler(file_handler)
@@ -323,6 +444,8 @@ def setup_logging(debug_mode: bool = False) -> None:
     logging.getLogger('selenium').setLevel(logging.WARNING)
     logging.getLogger('urllib3').setLevel(logging.WARNING)
 
+    _LOGGING_INITIALIZED = True
+
     if debug_mode:
         logging.info("Debug logging enabled")
 
@@ -4,7 +4,13 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.chrome.options import Options
-import time
+
+# CSS equivalents of the login page's absolute XPaths; native querySelector
+# lookups are cheaper than XPath evaluation on every WebDriverWait poll
+INITIAL_BUTTON_SELECTOR = "body > div > div:nth-of-type(2) > div > div:nth-of-type(2) > button"
+UNIVERSITY_FORM_SELECTOR = "app-root > app-login > div:nth-of-type(2) > main > div:nth-of-type(4) > div:nth-of-type(2) > div"
+UNIVERSITY_DROPDOWN_SELECTOR = f"{UNIVERSITY_FORM_SELECTOR} > select"
+CONTINUE_BUTTON_SELECTOR = f"{UNIVERSITY_FORM_SELECTOR} > button"
 
 def setup_chrome_driver(headless=True):
     """Set up Chrome driver with WebAuthn disabled
@@ -63,17 +69,15 @@ def navigate_to_university_selection(driver, university_name):
         
         print("Looking for initial button...")
         initial_button = wait.until(
-            EC.element_to_be_clickable((By.XPATH, "/html/body/div/div[2]/div/div[2]/button"))
+            EC.element_to_be_clickable((By.CSS_SELECTOR, INITIAL_BUTTON_SELECTOR))
         )
         
         print("Clicking initial button...")
         initial_button.click()
         
-        time.sleep(2)
-        
         print("Looking for university dropdown...")
         dropdown = wait.until(
-            EC.element_to_be_clickable((By.XPATH, "/html/body/app-root/app-login/div[2]/main/div[4]/div[2]/div/select"))
+            EC.element_to_be_clickable((By.CSS_SELECTOR, UNIVERSITY_DROPDOWN_SELECTOR))
         )
         
         print("Clicking dropdown...")
@@ -84,18 +88,21 @@ def navigate_to_university_selection(driver, university_name):
         
         print("Looking for continue button...")
         button = wait.until(
-            EC.presence_of_element_located((By.XPATH, "/html/body/app-root/app-login/div[2]/main/div[4]/div[2]/div/button"))
+            EC.presence_of_element_located((By.CSS_SELECTOR, CONTINUE_BUTTON_SELECTOR))
         )
         
         print("Scrolling to button...")
         driver.execute_script("arguments[0].scrollIntoView(true);", button)
-        time.sleep(1)
+        button = wait.until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, CONTINUE_BUTTON_SELECTOR))
+        )
         
         print("Clicking continue button...")
+        current_url = driver.current_url
         driver.execute_script("arguments[0].click();", button)
         
         print("Waiting for login page to load...")
-        time.sleep(3)
+        wait.until(EC.url_changes(current_url))
         
         return True
         
@@ -6,19 +6,78 @@ and automated answer submission.
 """
 
 import os
+import sys
+import select
 import time
-import asyncio
-from datetime import datetime
-from typing import Optional
+import base64
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 import logging
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.common.exceptions import WebDriverException
 
 from notifications.email_service import EmailNotificationService
 from ai_services.base_ai_service import BaseAIService, AIAnswerSuggestion
 
+if TYPE_CHECKING:
+    import asyncio
+
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+    # Pillow 9.1 moved the filters into Image.Resampling; older releases
+    # only have the module-level aliases
+    _LANCZOS = getattr(Image, 'Resampling', Image).LANCZOS
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+# Bounding box for uploaded screenshots; full-page captures are tall, so only
+# the width is effectively limited
+_UPLOAD_MAX_SIZE = (1280, 8000)
+
+
+def _write_screenshot(path: str, base64_data: str) -> str:
+    """Decode a base64 PNG, write it to disk and compress a WebP copy.
+
+    The PNG is kept as an archive. When Pillow is installed, a downscaled
+    and much smaller WebP copy is written next to it for email and AI
+    uploads.
+
+    Args:
+        path: Destination PNG file path
+        base64_data: Base64-encoded PNG data as returned by CDP
+
+    Returns:
+        Path of the file to upload (the WebP copy if created, else the PNG)
+    """
+    with open(path, 'wb', buffering=1 << 20) as f:
+        f.write(base64.b64decode(base64_data))
+
+    if not PIL_AVAILABLE:
+        return path
+
+    webp_path = os.path.splitext(path)[0] + '.webp'
+    try:
+        with Image.open(path) as image:
+            image.thumbnail(_UPLOAD_MAX_SIZE, _LANCZOS)
+            image.save(webp_path, 'WEBP', quality=85, method=4)
+        return webp_path
+    except Exception as e:
+        logger.warning(f"WebP compression failed, using PNG: {e}")
+        return path
+
 
 class QuestionMonitor:
     """Monitors iClicker sessions for questions and handles user responses.
@@ -33,22 +92,130 @@ class QuestionMonitor:
 
     Attributes:
         driver (WebDriver): Selenium WebDriver instance for browser control
-        polling_interval (int): Seconds between monitoring checks
+        polling_interval (int): Maximum seconds between monitoring checks
         email_service (Optional[EmailNotificationService]): Email notification service
         ai_service (Optional[BaseAIService]): AI service for answer suggestions
         questions_dir (str): Directory path for saving screenshots
-        question_xpath (str): XPath for detecting question elements
-        logger (logging.Logger): Logger instance for this monitor
+        question_selector (str): CSS selector for detecting question elements
     """
 
-    # XPath for detecting iClicker questions in the DOM
-    QUESTION_XPATH = "/html/body/app-root/ng-component/div/ng-component/app-poll/main/div/app-multiple-choice-question/div[3]"
+    # CSS selector for detecting iClicker questions in the DOM (equivalent to
+    # the absolute XPath .../app-poll/main/div/app-multiple-choice-question/div[3],
+    # but resolved by the browser's native querySelector)
+    QUESTION_SELECTOR = (
+        "app-root > ng-component > div > ng-component > app-poll > main > div"
+        " > app-multiple-choice-question > div:nth-of-type(3)"
+    )
 
     # CSS selector for detecting already-selected answer buttons
     SELECTED_BUTTON_SELECTOR = "button.btn-selected"
 
+    # Monitoring status line (spinner, elapsed seconds, attempt number);
+    # %d truncates the elapsed float without an explicit int() cast
+    STATUS_TEMPLATE = "\r%s Monitoring for questions... (elapsed: %ds, attempt: %d)"
+
+    # Seconds between spinner frames drawn by the status thread
+    STATUS_REFRESH_INTERVAL = 0.2
+
+    # Seconds to wait for a background screenshot write before giving up
+    SCREENSHOT_WRITE_TIMEOUT = 30
+
+    # Maximum number of AI suggestions kept in the question cache
+    AI_CACHE_MAX_ENTRIES = 128
+
     # Valid answer choices for iClicker questions
-    VALID_ANSWERS = ['A', 'B', 'C', 'D', 'E']
+    VALID_ANSWERS = frozenset({'A', 'B', 'C', 'D', 'E'})
+
+    # Answer choices as shown in prompts (fixed order, unlike the set above)
+    _VALID_ANSWERS_DISPLAY = "A, B, C, D, E"
+
+    # Locator templates for answer buttons, tried in order ({answer} is the
+    # choice letter, {lower} its lowercase form); CSS is used where possible
+    ANSWER_BUTTON_STRATEGIES = (
+        # Strategy 1: Look for buttons with specific answer text
+        (By.XPATH, "//button[contains(text(), '{answer}') or contains(@aria-label, '{answer}')]"),
+        # Strategy 2: Look for elements with answer classes
+        (By.CSS_SELECTOR, "button[class*='answer-{lower}']"),
+        (By.CSS_SELECTOR, "div[class*='answer-{lower}'] button"),
+        # Strategy 3: Look for radio buttons or inputs
+        (By.CSS_SELECTOR, "input[value='{answer}'], input[aria-label='{answer}']"),
+        # Strategy 4: Look for clickable elements with answer text
+        (By.XPATH, "//*[contains(text(), '{answer}') and (self::button or self::div[@role='button'] or self::a)]"),
+    )
+
+    # Tries [by, locator] pairs in order inside the page, then scrolls the
+    # first match into view and clicks it; returns the pair's index or -1
+    CLICK_ANSWER_SCRIPT = """
+        var strategies = arguments[0];
+        for (var i = 0; i < strategies.length; i++) {
+            var el = null;
+            try {
+                el = strategies[i][0] === 'xpath'
+                    ? document.evaluate(strategies[i][1], document, null,
+                        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                    : document.querySelector(strategies[i][1]);
+            } catch (e) {}
+            if (el) {
+                if (el.scrollIntoViewIfNeeded) { el.scrollIntoViewIfNeeded(); }
+                else { el.scrollIntoView({block: 'center'}); }
+                el.click();
+                return i;
+            }
+        }
+        return -1;
+    """
+
+    # Returns the question element's presence, visibility, answered state
+    # and raw textContent (used as a cheap identity key, no layout needed) in
+    # a single round trip (arguments: question selector, selected button
+    # selector). The element is cached on the page and only looked up again
+    # once it is detached or no longer matches the selector.
+    QUESTION_STATE_SCRIPT = """
+        var q = window.__iclickerQuestionEl;
+        if (!q || !q.isConnected || !q.matches(arguments[0])) {
+            q = window.__iclickerQuestionEl = document.querySelector(arguments[0]);
+        }
+        if (!q) { return {present: false}; }
+        var style = window.getComputedStyle(q);
+        return {
+            present: true,
+            displayed: style.display !== 'none' && style.visibility !== 'hidden'
+                && q.getClientRects().length > 0,
+            answered: !!document.querySelector(arguments[1]),
+            key: q.textContent || ''
+        };
+    """
+
+    # Returns the rendered (visible, line-broken) text of the cached question
+    # element; only run once per new question
+    QUESTION_TEXT_SCRIPT = (
+        "var q = window.__iclickerQuestionEl;"
+        "return q ? (q.innerText || '').trim() : null;"
+    )
+
+    # Installs (once per page load) a MutationObserver that raises a flag
+    # whenever the DOM changes while a question is, or just was, on the
+    # page, then returns and clears that flag. A fresh install reports a
+    # change so the first poll after any navigation does a full check.
+    QUESTION_CHANGE_SCRIPT = """
+        if (!window.__iclickerObserver) {
+            var update = function () {
+                var present = !!document.querySelector('app-multiple-choice-question');
+                if (present || window.__iclickerQuestionPresent) {
+                    window.__iclickerQuestionChanged = true;
+                }
+                window.__iclickerQuestionPresent = present;
+            };
+            window.__iclickerObserver = new MutationObserver(update);
+            window.__iclickerObserver.observe(document.documentElement, {
+                childList: true, subtree: true, attributes: true, characterData: true
+            });
+            window.__iclickerQuestionChanged = true;
+        }
+        var changed = window.__iclickerQuestionChanged;
+        window.__iclickerQuestionChanged = false;
+        return changed;
+    """
 
     def __init__(
         self,
@@ -79,16 +246,43 @@ class QuestionMonitor:
         self.ai_service = ai_service
         self._recipient_email = recipient_email
         self.questions_dir = "questions"
-        self.question_xpath = self.QUESTION_XPATH
+        self.question_selector = self.QUESTION_SELECTOR
+        self._questions_dir_prefix = self.questions_dir + os.sep
 
-        # Set up logging
-        self.logger = logging.getLogger(__name__)
+        # The login flow relies on the driver's implicit wait, but here a
+        # missing element must fail fast instead of blocking for the full
+        # implicit timeout. The monitor polls on its own schedule instead.
+        self.driver.implicitly_wait(0)
 
         # Internal state tracking
         self._current_question_text: Optional[str] = None
+        self._current_question_hash: Optional[int] = None
         self._question_active = False
         self._monitoring_active = False
 
+        # Adaptive poll delays, reset to the shortest on question state changes
+        self._backoff_schedule = self._build_backoff_schedule(polling_interval)
+        self._backoff_idx = 0
+
+        # Single background worker for screenshot disk writes
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qmon-io")
+
+        # Status spinner thread state: the event is set while the spinner may
+        # draw, and the lock keeps a frame from interleaving with other output
+        self._poll_attempt = 1
+        self._status_enabled = threading.Event()
+        self._status_lock = threading.Lock()
+
+        # Index of the answer button strategy that last succeeded
+        self._last_strategy_idx: Optional[int] = None
+
+        # LRU cache of AI suggestions by question digest, loaded on first use
+        self._ai_cache: Optional["OrderedDict[str, AIAnswerSuggestion]"] = None
+        self._ai_cache_path = os.path.join(self.questions_dir, "ai_cache.json")
+
+        # Persistent event loop for AI analysis, started on first use
+        self._ai_loop: Optional["asyncio.AbstractEventLoop"] = None
+
         # Create questions directory if needed
         self._ensure_questions_directory()
 
@@ -111,38 +305,91 @@ class QuestionMonitor:
             KeyboardInterrupt: When monitoring is manually interrupted
         """
         self._monitoring_active = True
-        self.logger.info(f"Starting question monitoring (polling every {self.polling_interval}s)")
+        logger.info(f"Starting question monitoring (polling every {self.polling_interval}s)")
         print(f"\n🔍 Starting question monitoring (polling every {self.polling_interval} seconds)")
         print("Waiting for questions to appear...")
 
-        start_time = time.time()
-        attempt = 1
-        spinner_chars = "|/-\\"
-        spinner_index = 0
+        self._poll_attempt = 1
+        status_thread = threading.Thread(
+            target=self._run_status_spinner,
+            args=(time.monotonic(),),
+            name="qmon-status",
+            daemon=True
+        )
+        status_thread.start()
+
+        # Loop-invariant lookups, bound once for the lifetime of the loop
+        schedule = self._backoff_schedule
+        last_idx = len(schedule) - 1
+        has_question_changed = self._has_question_changed
+        check_for_questions = self._check_for_questions
+        status_enabled = self._status_enabled
+
+        # Set when a full check fails: the page flag was already cleared, so
+        # the next poll must check again instead of waiting for a mutation
+        recheck = False
 
         try:
             while self._monitoring_active:
-                # Check for questions and handle them
-                self._check_for_questions()
+                # Only inspect the DOM when the page reports a question change
+                was_active = self._question_active
+                if recheck or has_question_changed():
+                    recheck = not check_for_questions()
 
-                # Show spinner when no question is active
+                # Let the spinner run when no question is active
                 if not self._question_active:
-                    self._display_monitoring_status(start_time, attempt, spinner_chars[spinner_index % len(spinner_chars)])
-                    spinner_index += 1
+                    status_enabled.set()
+
+                # Poll quickly right after a state change, backing off while idle
+                if self._question_active != was_active:
+                    self._backoff_idx = 0
+                elif self._backoff_idx < last_idx:
+                    self._backoff_idx += 1
 
                 # Wait before next check
-                time.sleep(self.polling_interval)
-                attempt += 1
+                time.sleep(schedule[self._backoff_idx])
+                self._poll_attempt += 1
 
         except KeyboardInterrupt:
-            self.logger.info("Question monitoring interrupted by user")
+            self._pause_status()
+            logger.info("Question monitoring interrupted by user")
             print("\n🛑 Question monitoring interrupted by user")
         except Exception as e:
-            self.logger.error(f"Unexpected error in question monitoring: {e}")
+            self._pause_status()
+            logger.error(f"Unexpected error in question monitoring: {e}")
             print(f"\n❌ Unexpected error in monitoring: {e}")
             raise
         finally:
             self._monitoring_active = False
+            self._pause_status()
+            status_thread.join(timeout=1.0)
+
+    @staticmethod
+    def _build_backoff_schedule(polling_interval: int) -> List[float]:
+        """Build the exponential poll delay schedule capped at the polling interval.
+
+        Args:
+            polling_interval: Maximum seconds between monitoring checks
+
+        Returns:
+            Increasing list of delays, e.g. [0.5, 1, 2, 4, 5] for a 5 second interval
+        """
+        schedule = [delay for delay in (0.5, 1, 2, 4, 8) if delay < polling_interval]
+        schedule.append(polling_interval)
+        return schedule
+
+    def close(self) -> None:
+        """Release background workers and connections used by the monitor.
+
+        Pending screenshot writes and emails are allowed to finish; AI work
+        is abandoned.
+        """
+        self._io_pool.shutdown(wait=True)
+        if self.email_service:
+            self.email_service.close()
+        if self._ai_loop is not None:
+            self._ai_loop.call_soon_threadsafe(self._ai_loop.stop)
+            self._ai_loop = None
 
     def stop_monitoring(self) -> None:
         """Stop the question monitoring loop.
@@ -151,113 +398,165 @@ class QuestionMonitor:
         another thread to stop monitoring.
         """
         self._monitoring_active = False
-        self.logger.info("Question monitoring stopped")
+        logger.info("Question monitoring stopped")
 
-    def _check_for_questions(self) -> None:
+    def _has_question_changed(self) -> bool:
+        """Check whether the question area changed since the last poll.
+
+        Uses a MutationObserver installed in the page so that idle polls
+        cost a single lightweight script call instead of a full DOM
+        inspection.
+
+        Returns:
+            True if the question DOM changed (or the check failed), False otherwise
+        """
+        try:
+            return bool(self.driver.execute_script(self.QUESTION_CHANGE_SCRIPT))
+        except WebDriverException as e:
+            logger.debug(f"Question change check failed, falling back to full check: {e}")
+            return True
+
+    def _check_for_questions(self) -> bool:
         """Check for questions and process them if found.
 
         This method handles the core question detection and processing logic:
-        1. Looks for question elements in the DOM
+        1. Fetches the question element state from the DOM in one script call
         2. Checks if questions are already answered
         3. Processes new questions with screenshots and user interaction
+
+        Returns:
+            True if the check completed, False if it failed and should be retried
         """
         try:
-            # Look for question element
-            question_element = self.driver.find_element(By.XPATH, self.question_xpath)
-
-            if not question_element.is_displayed():
+            # Fetch presence, visibility, answered state and text in one call
+            state = self.driver.execute_script(
+                self.QUESTION_STATE_SCRIPT, self.question_selector, self.SELECTED_BUTTON_SELECTOR
+            ) or {}
+
+            if not state.get('present'):
+                # No question element found - reset state if needed
+                if self._question_active:
+                    self._handle_question_disappeared()
+                return True
+
+            if not state.get('displayed'):
                 self._handle_question_disappeared()
-                return
+                return True
 
             # Check if question is already answered
-            if self._is_question_answered():
+            if self._is_question_answered(state):
                 self._handle_already_answered_question()
-                return
-
-            # Extract question text
-            question_text = self._extract_question_text(question_element)
+                return True
 
-            # Check if this is a new question
-            if self._is_new_question(question_text):
-                self._process_new_question(question_text)
+            # Check if this is a new question, reading its rendered text only then
+            question_key = state.get('key', '')
+            if self._is_new_question(question_key):
+                question_text = self._extract_question_text()
+                self._process_new_question(question_text, question_key)
+            return True
 
-        except NoSuchElementException:
-            # No question element found - reset state if needed
-            if self._question_active:
-                self._handle_question_disappeared()
         except WebDriverException as e:
-            self.logger.warning(f"WebDriver error while checking for questions: {e}")
+            logger.warning(f"WebDriver error while checking for questions: {e}")
         except Exception as e:
-            self.logger.error(f"Unexpected error checking for questions: {e}")
+            logger.error(f"Unexpected error checking for questions: {e}")
+        return False
 
-    def _is_question_answered(self) -> bool:
+    def _is_question_answered(self, state: Dict[str, Any]) -> bool:
         """Check if the current question has already been answered.
 
+        Args:
+            state: Question state returned by QUESTION_STATE_SCRIPT
+
         Returns:
-            True if a selected answer button is found, False otherwise
+            True if a selected answer button is present, False otherwise
         """
-        try:
-            selected_buttons = self.driver.find_elements(By.CSS_SELECTOR, self.SELECTED_BUTTON_SELECTOR)
-            return len(selected_buttons) > 0
-        except WebDriverException:
-            return False
-
-    def _extract_question_text(self, question_element) -> str:
-        """Extract text content from a question element.
+        return bool(state.get('answered'))
 
-        Args:
-            question_element: Selenium WebElement containing the question
+    def _extract_question_text(self) -> str:
+        """Extract the rendered text of the current question element.
 
         Returns:
             Extracted question text, or a default message if extraction fails
         """
         try:
-            return question_element.text.strip()
+            text = self.driver.execute_script(self.QUESTION_TEXT_SCRIPT)
         except Exception as e:
-            self.logger.warning(f"Failed to extract question text: {e}")
+            logger.warning(f"Failed to extract question text: {e}")
+            text = None
+
+        if text is None:
             return "Question content not available"
+        return text
 
-    def _is_new_question(self, question_text: str) -> bool:
+    def _is_new_question(self, question_key: str) -> bool:
         """Determine if this is a new question that hasn't been processed.
 
         Args:
-            question_text: Text content of the current question
+            question_key: Raw text content identifying the current question
 
         Returns:
             True if this is a new question, False if already processed
         """
-        return not self._question_active or question_text != self._current_question_text
+        return not self._question_active or hash(question_key) != self._current_question_hash
 
-    def _process_new_question(self, question_text: str) -> None:
+    def _process_new_question(self, question_text: str, question_key: Optional[str] = None) -> None:
         """Process a newly detected question.
 
         Args:
             question_text: Text content of the question
+            question_key: Raw text content identifying the question
+                (defaults to question_text)
         """
         self._current_question_text = question_text
+        self._current_question_hash = hash(question_text if question_key is None else question_key)
         self._question_active = True
+        self._pause_status()
 
-        self.logger.info("New iClicker question detected")
-        print("\n🚨 QUESTION DETECTED! 🚨")
-        print("📋 An iClicker question has appeared on the page!")
+        logger.info("New iClicker question detected")
+        sys.stdout.write("\n🚨 QUESTION DETECTED! 🚨\n📋 An iClicker question has appeared on the page!\n")
+        sys.stdout.flush()
 
-        # Take screenshot
-        screenshot_path = self._capture_screenshot()
+        # Take screenshot; the write future is bound here and handed to its
+        # consumers so a later question's capture can't be picked up instead
+        screenshot_path, screenshot_future, screenshot_digest = self._capture_screenshot()
 
-        # Get AI suggestion if enabled
+        # Get AI suggestion if enabled, reusing one for a previously seen question
         ai_suggestion = None
-        if self.ai_service and screenshot_path:
-            ai_suggestion = self._get_ai_suggestion(screenshot_path, question_text)
+        if self.ai_service:
+            cache_key = self._ai_cache_key(
+                question_text if question_key is None else question_key, screenshot_digest
+            )
+            ai_suggestion = self._get_cached_ai_suggestion(cache_key)
+            if ai_suggestion:
+                print("🤖 Reusing AI suggestion from a previously seen question")
+                logger.info("AI suggestion served from cache")
+            elif screenshot_path:
+                # Let the I/O worker do the SMTP handshake while the AI
+                # request is in flight, so the email goes out right after
+                if self.email_service and self._recipient_email:
+                    smtp_future = self._io_pool.submit(self.email_service.prepare_connection)
+                    smtp_future.add_done_callback(self._log_background_failure)
+                ai_suggestion = self._get_ai_suggestion(screenshot_path, question_text, screenshot_future)
+                if ai_suggestion:
+                    self._store_ai_suggestion(cache_key, ai_suggestion)
 
-        # Send email notification if configured
+        # Send email notification in the background if configured. The I/O
+        # worker runs tasks in order, so the screenshot write queued earlier
+        # has finished by the time the email task starts.
+        email_future: Optional[Future] = None
         if self.email_service and screenshot_path:
-            self._send_email_notification(question_text, screenshot_path, ai_suggestion)
-
-        # Display question and AI suggestion
-        print(f"❓ Question content:\n{question_text}")
+            print("📧 Sending email notification...")
+            email_future = self._io_pool.submit(
+                self._send_email_notification, question_text, screenshot_path, ai_suggestion, screenshot_future
+            )
+            email_future.add_done_callback(self._log_background_failure)
 
+        # Display question and AI suggestion in a single write
+        out = [f"❓ Question content:\n{question_text}"]
         if ai_suggestion:
-            self._display_ai_suggestion(ai_suggestion)
+            out.append(self._format_ai_suggestion(ai_suggestion))
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
 
         # Get user input (with AI suggestion as context)
         user_answer = self._get_user_answer(ai_suggestion)
@@ -266,13 +565,34 @@ class QuestionMonitor:
         if user_answer:
             self._click_answer(user_answer)
 
+        self._report_email_status(email_future)
         print("🔄 Waiting for next question...\n")
 
+    def _report_email_status(self, email_future: Optional[Future]) -> None:
+        """Print the outcome of a background email once the prompt is done.
+
+        Does not wait for an email still in flight; its outcome is logged
+        by the I/O worker instead.
+
+        Args:
+            email_future: Future of the email task, or None if none was sent
+        """
+        if email_future is None:
+            return
+        if not email_future.done():
+            print("📧 Email notification still sending in the background")
+            return
+        if not email_future.cancelled() and email_future.exception() is None:
+            status = email_future.result()
+            if status:
+                print(status)
+
     def _handle_question_disappeared(self) -> None:
         """Handle the case when a question is no longer visible."""
         if self._question_active:
             self._question_active = False
             self._current_question_text = None
+            self._current_question_hash = None
             print("📝 Question ended. Waiting for next question...")
 
     def _handle_already_answered_question(self) -> None:
@@ -280,156 +600,293 @@ class QuestionMonitor:
         if self._question_active:
             self._question_active = False
             self._current_question_text = None
+            self._current_question_hash = None
             print("✅ Question already answered, waiting for next question...")
 
-    def _capture_screenshot(self) -> Optional[str]:
+    def _capture_screenshot(self) -> Tuple[Optional[str], Optional[Future], Optional[str]]:
         """Capture a full-page screenshot of the current question.
 
         Returns:
-            Path to the saved screenshot file, or None if capture failed
+            Tuple of the screenshot path (None if capture failed), the future
+            of its background write (None if it was written directly) and a
+            SHA-256 digest of the image (None if capture failed)
         """
         try:
             # Generate unique filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            screenshot_filename = f"question_{timestamp}.png"
-            screenshot_path = os.path.join(self.questions_dir, screenshot_filename)
-
-            # Save current window size
-            original_size = self.driver.get_window_size()
-
-            # Calculate total page height for full capture
-            total_height = self.driver.execute_script(
-                "return Math.max("
-                "document.body.scrollHeight, document.body.offsetHeight, "
-                "document.documentElement.clientHeight, "
-                "document.documentElement.scrollHeight, "
-                "document.documentElement.offsetHeight"
-                ");"
-            )
+            from datetime import datetime
+            screenshot_path = f"{self._questions_dir_prefix}question_{datetime.now():%Y%m%d_%H%M%S}.png"
 
-            # Resize window to capture full page
-            self.driver.set_window_size(original_size['width'], total_height)
+            # Capture the full scrollable page in one CDP call, without
+            # resizing the window or waiting for a relayout
+            result = self.driver.execute_cdp_cmd("Page.captureScreenshot", {
+                "format": "png",
+                "captureBeyondViewport": True,
+                "fromSurface": True
+            })
 
-            # Scroll to top and take screenshot
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(0.5)  # Allow page to settle
-            self.driver.save_screenshot(screenshot_path)
+            # Decode and write in the background; consumers wait on the future
+            write_future = self._io_pool.submit(_write_screenshot, screenshot_path, result['data'])
+            digest = hashlib.sha256(result['data'].encode('ascii')).hexdigest()
 
-            # Restore original window size
-            self.driver.set_window_size(original_size['width'], original_size['height'])
-
-            print(f"📸 Full page screenshot saved: {screenshot_path}")
-            self.logger.info(f"Screenshot captured: {screenshot_path}")
-            return screenshot_path
+            print(f"📸 Full page screenshot captured: {screenshot_path}")
+            logger.info(f"Screenshot captured: {screenshot_path}")
+            return screenshot_path, write_future, digest
 
         except Exception as e:
-            self.logger.error(f"Failed to capture screenshot: {e}")
+            logger.error(f"Failed to capture screenshot: {e}")
             print(f"❌ Failed to save screenshot: {e}")
 
             # Try fallback regular screenshot
             try:
                 fallback_path = screenshot_path.replace('.png', '_fallback.png')
                 self.driver.save_screenshot(fallback_path)
+                with open(fallback_path, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
                 print(f"📸 Fallback screenshot saved: {fallback_path}")
-                return fallback_path
+                return fallback_path, None, digest
             except Exception:
                 print("❌ Both full page and fallback screenshots failed")
-                return None
+                return None, None, None
 
-    def _get_ai_suggestion(self, screenshot_path: str, question_text: str) -> Optional[AIAnswerSuggestion]:
+    def _log_background_failure(self, future: Future) -> None:
+        """Log an exception raised by a background task, if any.
+
+        Args:
+            future: Completed future of the background task
+        """
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Background task failed: {future.exception()}")
+
+    def _wait_for_screenshot(self, screenshot_path: str, screenshot_future: Optional[Future]) -> Optional[str]:
+        """Wait for a background screenshot write to finish.
+
+        Args:
+            screenshot_path: Path returned by _capture_screenshot
+            screenshot_future: Write future returned alongside that path, or
+                None if the file was written directly
+
+        Returns:
+            Path of the file to upload (possibly a compressed copy), or None
+            if writing the screenshot failed or timed out
+        """
+        if screenshot_future is None:
+            return screenshot_path
+
+        try:
+            return screenshot_future.result(timeout=self.SCREENSHOT_WRITE_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Failed to write screenshot: {e}")
+            return None
+
+    def _get_ai_suggestion(
+        self,
+        screenshot_path: str,
+        question_text: str,
+        screenshot_future: Optional[Future] = None
+    ) -> Optional[AIAnswerSuggestion]:
         """Get AI suggestion for the question.
 
         Args:
             screenshot_path: Path to the screenshot file
             question_text: Text content of the question
+            screenshot_future: Pending background write of the screenshot
 
         Returns:
             AI suggestion or None if failed
         """
         print("🤖 Getting AI answer suggestion...")
 
+        upload_path = self._wait_for_screenshot(screenshot_path, screenshot_future)
+        if not upload_path:
+            print("❌ AI analysis skipped: screenshot could not be saved")
+            return None
+
+        # asyncio is only needed when an AI service is configured
+        import asyncio
+
         try:
-            # Handle async AI analysis properly
+            # Schedule the coroutine on the persistent AI event loop
+            future = asyncio.run_coroutine_threadsafe(
+                self.ai_service.analyze_question(upload_path, question_text),
+                self._get_ai_loop()
+            )
             try:
-                # Try to get existing event loop
-                loop = asyncio.get_running_loop()
-                # If we're already in an event loop, we can't use run_until_complete
-                # So we'll need to run in a thread pool
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(self._run_ai_analysis_sync, screenshot_path, question_text)
-                    suggestion = future.result(timeout=30)  # 30 second timeout
-            except RuntimeError:
-                # No event loop running, we can create one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    suggestion = loop.run_until_complete(
-                        self.ai_service.analyze_question(screenshot_path, question_text)
-                    )
-                finally:
-                    loop.close()
+                suggestion = future.result(timeout=30)  # 30 second timeout
+            except Exception:
+                future.cancel()
+                raise
 
             print("✅ AI analysis completed")
-            self.logger.info(f"AI suggested answer: {suggestion.suggested_answer} ({suggestion.confidence_percentage})")
+            logger.info(f"AI suggested answer: {suggestion.suggested_answer} ({suggestion.confidence_percentage})")
             return suggestion
 
         except Exception as e:
             print(f"❌ AI analysis failed: {e}")
-            self.logger.error(f"AI analysis error: {e}")
+            logger.error(f"AI analysis error: {e}")
             return None
 
-    def _run_ai_analysis_sync(self, screenshot_path: str, question_text: str) -> AIAnswerSuggestion:
-        """Run AI analysis in a synchronous manner for thread pool execution.
+    @staticmethod
+    def _ai_cache_key(question_key: str, screenshot_digest: Optional[str]) -> Optional[str]:
+        """Build a stable cache key for a question's AI suggestion.
+
+        The AI answers mostly from the screenshot, and slide questions often
+        share boilerplate text, so the key covers both the text and the
+        image. A content digest is used rather than hash() so keys stay
+        valid across restarts (str hashes are randomized per process).
 
         Args:
-            screenshot_path: Path to the screenshot file
-            question_text: Text content of the question
+            question_key: Text identifying the question
+            screenshot_digest: SHA-256 hex digest of the question screenshot
 
         Returns:
-            AI suggestion
+            Hex digest of the text and screenshot, or None if there is no
+            screenshot to key on
         """
-        # Create a new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(
-                self.ai_service.analyze_question(screenshot_path, question_text)
-            )
-        finally:
-            loop.close()
+        if not screenshot_digest:
+            return None
+        return hashlib.sha256(f"{question_key}\0{screenshot_digest}".encode('utf-8')).hexdigest()
 
-    def _display_ai_suggestion(self, suggestion: AIAnswerSuggestion) -> None:
-        """Display AI suggestion to the user.
+    def _load_ai_cache(self) -> "OrderedDict[str, AIAnswerSuggestion]":
+        """Return the AI suggestion cache, loading it from disk on first use.
+
+        Returns:
+            Ordered mapping of question digest to suggestion, oldest first
+        """
+        if self._ai_cache is None:
+            self._ai_cache = OrderedDict()
+            try:
+                with open(self._ai_cache_path, 'r', encoding='utf-8') as f:
+                    for key, data in json.load(f):
+                        self._ai_cache[key] = AIAnswerSuggestion(**data)
+                logger.debug(f"Loaded {len(self._ai_cache)} cached AI suggestions")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable AI cache {self._ai_cache_path}: {e}")
+        return self._ai_cache
+
+    def _get_cached_ai_suggestion(self, cache_key: Optional[str]) -> Optional[AIAnswerSuggestion]:
+        """Look up a cached AI suggestion, marking it as recently used.
+
+        Args:
+            cache_key: Key from _ai_cache_key
+
+        Returns:
+            Cached suggestion, or None on a miss
+        """
+        if cache_key is None:
+            return None
+
+        cache = self._load_ai_cache()
+        suggestion = cache.get(cache_key)
+        if suggestion is not None:
+            cache.move_to_end(cache_key)
+        return suggestion
+
+    def _store_ai_suggestion(self, cache_key: Optional[str], suggestion: AIAnswerSuggestion) -> None:
+        """Cache an AI suggestion, evicting the least recently used entries.
+
+        The cache is persisted to disk on the background I/O worker.
+
+        Args:
+            cache_key: Key from _ai_cache_key
+            suggestion: Suggestion to cache
+        """
+        if cache_key is None:
+            return
+
+        cache = self._load_ai_cache()
+        cache[cache_key] = suggestion
+        cache.move_to_end(cache_key)
+        while len(cache) > self.AI_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+        entries = [[key, asdict(value)] for key, value in cache.items()]
+        save_future = self._io_pool.submit(self._save_ai_cache, entries)
+        save_future.add_done_callback(self._log_background_failure)
+
+    def _save_ai_cache(self, entries: List[List[Any]]) -> None:
+        """Write the AI suggestion cache to disk.
+
+        Args:
+            entries: Serializable [key, suggestion dict] pairs, oldest first
+        """
+        tmp_path = self._ai_cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self._ai_cache_path)
+
+    def _get_ai_loop(self) -> "asyncio.AbstractEventLoop":
+        """Return the background event loop used for AI analysis.
+
+        The loop is created on first use and runs forever on a daemon
+        thread, so each question only schedules a coroutine on it.
+
+        Returns:
+            Running asyncio event loop
+        """
+        if self._ai_loop is None:
+            import asyncio
+            self._ai_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=self._ai_loop.run_forever, name="qmon-ai-loop", daemon=True
+            ).start()
+        return self._ai_loop
+
+    def _format_ai_suggestion(self, suggestion: AIAnswerSuggestion) -> str:
+        """Format an AI suggestion for display to the user.
 
         Args:
             suggestion: AI answer suggestion to display
+
+        Returns:
+            Multi-line suggestion block, without a trailing newline
         """
-        print("\n🤖 AI SUGGESTION:")
-        print(f"   Answer: {suggestion.suggested_answer}")
-        print(f"   Confidence: {suggestion.confidence_percentage}")
-        print(f"   Reasoning: {suggestion.reasoning}")
-        print(f"   Model: {suggestion.model_used}")
-        print(f"   Processing time: {suggestion.processing_time:.2f}s")
-
-    def _send_email_notification(self, question_text: str, screenshot_path: str, ai_suggestion: Optional[AIAnswerSuggestion] = None) -> None:
+        return (
+            "\n🤖 AI SUGGESTION:\n"
+            f"   Answer: {suggestion.suggested_answer}\n"
+            f"   Confidence: {suggestion.confidence_percentage}\n"
+            f"   Reasoning: {suggestion.reasoning}\n"
+            f"   Model: {suggestion.model_used}\n"
+            f"   Processing time: {suggestion.processing_time:.2f}s"
+        )
+
+    def _send_email_notification(
+        self,
+        question_text: str,
+        screenshot_path: str,
+        ai_suggestion: Optional[AIAnswerSuggestion] = None,
+        screenshot_future: Optional[Future] = None
+    ) -> Optional[str]:
         """Send email notification for a detected question.
 
+        Runs on the I/O worker, so it reports through the logger and its
+        return value instead of printing over the answer prompt.
+
         Args:
             question_text: Text content of the question
             screenshot_path: Path to the screenshot file
             ai_suggestion: Optional AI suggestion to include
+            screenshot_future: Pending background write of this question's
+                screenshot, bound when the email task was submitted
+
+        Returns:
+            Status line for the main thread to print, or None if no email
+            was attempted
         """
         if not self.email_service:
-            return
-
-        print("📧 Sending email notification...")
+            return None
 
         try:
             # Check if we have both email service and recipient configured
             if not self._recipient_email:
-                self.logger.warning("No recipient email configured for notifications")
-                return
+                logger.warning("No recipient email configured for notifications")
+                return None
+
+            upload_path = self._wait_for_screenshot(screenshot_path, screenshot_future)
+            if not upload_path:
+                logger.warning("Email notification skipped: screenshot could not be saved")
+                return "❌ Email notification skipped: screenshot could not be saved"
 
             # Create enhanced question text with AI suggestion
             enhanced_question_text = question_text
@@ -439,19 +896,18 @@ class QuestionMonitor:
             success = self.email_service.send_question_alert(
                 recipient_email=self._recipient_email,
                 question_text=enhanced_question_text,
-                screenshot_path=screenshot_path
+                screenshot_path=upload_path
             )
 
             if success:
-                print("✅ Email notification sent successfully")
-                self.logger.info("Email notification sent")
-            else:
-                print("❌ Email notification failed")
-                self.logger.warning("Email notification failed")
+                logger.info("Email notification sent")
+                return "✅ Email notification sent successfully"
+            logger.warning("Email notification failed")
+            return "❌ Email notification failed"
 
         except Exception as e:
-            print(f"❌ Email notification error: {e}")
-            self.logger.error(f"Email notification error: {e}")
+            logger.error(f"Email notification error: {e}")
+            return f"❌ Email notification error: {e}"
 
     def _get_user_answer(self, ai_suggestion: Optional[AIAnswerSuggestion] = None) -> Optional[str]:
         """Prompt user to select an answer choice.
@@ -466,11 +922,15 @@ class QuestionMonitor:
             try:
                 # Create prompt with AI suggestion context
                 if ai_suggestion:
-                    prompt = f"\n⚡ Select your answer (A, B, C, D, E) [AI suggests: {ai_suggestion.suggested_answer}]: "
+                    prompt = f"\n⚡ Select your answer ({self._VALID_ANSWERS_DISPLAY}) [AI suggests: {ai_suggestion.suggested_answer}]: "
                 else:
-                    prompt = "\n⚡ Select your answer (A, B, C, D, E): "
+                    prompt = f"\n⚡ Select your answer ({self._VALID_ANSWERS_DISPLAY}): "
 
-                user_input = input(prompt).strip().upper()
+                user_input = self._read_answer_input(prompt)
+                if user_input is None:
+                    print("\n⏹️  Question closed before an answer was selected")
+                    logger.info("Question closed while waiting for user answer")
+                    return None
 
                 # If user just presses enter and we have an AI suggestion, use it
                 if not user_input and ai_suggestion:
@@ -486,71 +946,153 @@ class QuestionMonitor:
 
             except KeyboardInterrupt:
                 print("\n🛑 Answer selection interrupted")
-                self.logger.info("Answer selection interrupted by user")
+                logger.info("Answer selection interrupted by user")
                 return None
             except EOFError:
                 print("\n🛑 Input stream closed")
                 return None
 
+    def _read_answer_input(self, prompt: str) -> Optional[str]:
+        """Read one line of user input while watching the question state.
+
+        On platforms where stdin can be polled with select(), the question
+        keeps being checked while waiting, and the prompt is abandoned if
+        it is closed or answered in the browser. Elsewhere this falls back
+        to a blocking input().
+
+        Args:
+            prompt: Prompt text to display
+
+        Returns:
+            Upper-cased, stripped input, or None if the question went away
+
+        Raises:
+            EOFError: If the input stream is closed
+        """
+        if os.name == 'nt':
+            return input(prompt).strip().upper()
+
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+
+        while True:
+            try:
+                ready, _, _ = select.select([sys.stdin], [], [], self.polling_interval)
+            except (OSError, ValueError):
+                # stdin is not selectable (e.g. replaced stream); block instead
+                return input().strip().upper()
+
+            if ready:
+                line = sys.stdin.readline()
+                if not line:
+                    raise EOFError
+                return line.strip().upper()
+
+            if not self._is_question_open():
+                return None
+
+    def _is_question_open(self) -> bool:
+        """Check whether the current question is still shown and unanswered.
+
+        Returns:
+            True if the same question is displayed and unanswered (or the
+            check failed), False otherwise
+        """
+        try:
+            state = self.driver.execute_script(
+                self.QUESTION_STATE_SCRIPT, self.question_selector, self.SELECTED_BUTTON_SELECTOR
+            ) or {}
+        except WebDriverException:
+            return True
+
+        if not (state.get('present') and state.get('displayed')):
+            return False
+        if self._is_question_answered(state):
+            return False
+        return not self._is_new_question(state.get('key', ''))
+
     def _click_answer(self, answer: str) -> None:
         """Attempt to click the selected answer button.
 
         Uses multiple strategies to locate and click the answer button,
-        providing fallbacks if the primary method fails.
+        providing fallbacks if the primary method fails. All strategies are
+        tried in the page by a single script call.
 
         Args:
             answer: The selected answer choice (A, B, C, D, E)
         """
         print(f"🖱️  Attempting to click answer {answer}...")
 
-        # Multiple strategies for finding answer buttons
-        strategies = [
-            # Strategy 1: Look for buttons with specific answer text
-            f"//button[contains(text(), '{answer}') or contains(@aria-label, '{answer}')]",
-            # Strategy 2: Look for elements with answer classes
-            f"//button[contains(@class, 'answer-{answer.lower()}')]",
-            f"//div[contains(@class, 'answer-{answer.lower()}')]//button",
-            # Strategy 3: Look for radio buttons or inputs
-            f"//input[@value='{answer}' or @aria-label='{answer}']",
-            # Strategy 4: Look for clickable elements with answer text
-            f"//*[contains(text(), '{answer}') and (self::button or self::div[@role='button'] or self::a)]"
-        ]
-
-        for i, strategy_xpath in enumerate(strategies, 1):
-            try:
-                answer_buttons = self.driver.find_elements(By.XPATH, strategy_xpath)
-                if answer_buttons:
-                    button = answer_buttons[0]
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                    time.sleep(0.5)
-                    self.driver.execute_script("arguments[0].click();", button)
+        # Try the strategy that worked last time first
+        order = list(range(len(self.ANSWER_BUTTON_STRATEGIES)))
+        if self._last_strategy_idx is not None:
+            order.remove(self._last_strategy_idx)
+            order.insert(0, self._last_strategy_idx)
 
-                    print(f"✅ Successfully clicked answer {answer}!")
-                    self.logger.info(f"Answer {answer} clicked using strategy {i}")
-                    return
+        strategies = []
+        for idx in order:
+            by, template = self.ANSWER_BUTTON_STRATEGIES[idx]
+            strategies.append([by, template.format(answer=answer, lower=answer.lower())])
 
-            except Exception as e:
-                self.logger.debug(f"Answer clicking strategy {i} failed: {e}")
-                continue
+        try:
+            matched = self.driver.execute_script(self.CLICK_ANSWER_SCRIPT, strategies)
+        except WebDriverException as e:
+            logger.debug(f"Answer clicking script failed: {e}")
+            matched = -1
+
+        if matched is not None and matched >= 0:
+            idx = order[matched]
+            self._last_strategy_idx = idx
+            print(f"✅ Successfully clicked answer {answer}!")
+            logger.info(f"Answer {answer} clicked using strategy {idx + 1}")
+            return
 
         # If all strategies failed
         print(f"❌ Could not automatically click answer {answer}")
         print("Please manually click the answer in your browser.")
-        self.logger.warning(f"Failed to click answer {answer} with all strategies")
+        logger.warning(f"Failed to click answer {answer} with all strategies")
 
     def _ensure_questions_directory(self) -> None:
         """Ensure the questions directory exists for screenshot storage."""
-        if not os.path.exists(self.questions_dir):
-            os.makedirs(self.questions_dir)
-            self.logger.info(f"Created questions directory: {self.questions_dir}")
+        os.makedirs(self.questions_dir, exist_ok=True)
+
+    def _run_status_spinner(self, start_time: float) -> None:
+        """Draw the monitoring status line until monitoring stops.
+
+        Runs on its own thread so the spinner keeps a steady cadence
+        independent of the poll delay, and pauses whenever a question
+        is being handled.
+
+        Args:
+            start_time: Monotonic time when monitoring started
+        """
+        spinner_chars = "|/-\\"
+        spinner_index = 0
+
+        while self._monitoring_active:
+            if not self._status_enabled.wait(timeout=self.STATUS_REFRESH_INTERVAL):
+                continue
+            with self._status_lock:
+                if self._status_enabled.is_set():
+                    self._display_monitoring_status(
+                        start_time, self._poll_attempt, spinner_chars[spinner_index % len(spinner_chars)]
+                    )
+            spinner_index += 1
+            time.sleep(self.STATUS_REFRESH_INTERVAL)
+
+    def _pause_status(self) -> None:
+        """Stop the spinner and wait for any frame being drawn to finish."""
+        self._status_enabled.clear()
+        with self._status_lock:
+            pass
 
     def _display_monitoring_status(self, start_time: float, attempt: int, spinner_char: str) -> None:
         """Display the current monitoring status with spinner.
 
         Args:
-            start_time: Time when monitoring started
+            start_time: Monotonic time when monitoring started
             attempt: Current monitoring attempt number
             spinner_char: Character to display as spinner
         """
-        elapsed = int(time.time() - start_time)
-        print(f"\r{spinner_char} Monitoring for questions... (elapsed: {elapsed}s, attempt: {attempt})", end="", flush=True)
\ No newline at end of file
+        sys.stdout.write(self.STATUS_TEMPLATE % (spinner_char, time.monotonic() - start_time, attempt))
+        sys.stdout.flush()
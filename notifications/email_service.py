@@ -6,14 +6,34 @@ including screenshot attachments and formatted message content.
 
 import os
 import smtplib
+import threading
 from datetime import datetime
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.image import MIMEImage
+from email.message import EmailMessage
 from typing import Optional
 import logging
 
 
+logger = logging.getLogger(__name__)
+
+# Message templates, filled in per alert with str.format
+_SUBJECT_TEMPLATE = "iClicker Question Alert - {timestamp}"
+
+_BODY_TEMPLATE = """🚨 iClicker Question Detected! 🚨
+
+Time: {timestamp}
+
+Question Content:
+{question_text}
+
+Please see the attached screenshot for the complete question and answer options.
+
+You can respond to this question in your iClicker session.
+
+---
+Sent automatically by iClicker Evade
+For support: https://github.com/username/iclicker-evade"""
+
+
 class EmailNotificationService:
     """Gmail-based email notification service.
 
@@ -26,6 +46,7 @@ class EmailNotificationService:
         sender_password (str): Gmail app password for authentication
         smtp_server (str): Gmail SMTP server address
         smtp_port (int): Gmail SMTP server port
+        smtp_timeout (int): Socket timeout in seconds for SMTP operations
     """
 
     def __init__(self, sender_email: str, sender_password: str) -> None:
@@ -45,9 +66,12 @@ class EmailNotificationService:
         self.sender_password = sender_password
         self.smtp_server = "smtp.gmail.com"
         self.smtp_port = 587
+        self.smtp_timeout = 15  # seconds, for connect and each SMTP command
 
-        # Set up logging for this service
-        self.logger = logging.getLogger(__name__)
+        # Authenticated connection reused across sends; the lock serializes
+        # sends and handshakes coming from different threads
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
 
     def send_question_alert(
         self,
@@ -90,11 +114,11 @@ class EmailNotificationService:
             # Send via Gmail SMTP
             self._send_via_smtp(msg)
 
-            self.logger.info(f"Successfully sent question alert to {recipient_email}")
+            logger.info(f"Successfully sent question alert to {recipient_email}")
             return True
 
         except Exception as e:
-            self.logger.error(f"Failed to send email to {recipient_email}: {e}")
+            logger.error(f"Failed to send email to {recipient_email}: {e}")
             return False
 
     def _create_question_message(
@@ -102,7 +126,7 @@ class EmailNotificationService:
         recipient_email: str,
         question_text: str,
         screenshot_path: str
-    ) -> MIMEMultipart:
+    ) -> EmailMessage:
         """Create a formatted email message for question alerts.
 
         Args:
@@ -111,23 +135,22 @@ class EmailNotificationService:
             screenshot_path: Path to screenshot file
 
         Returns:
-            Formatted MIMEMultipart email message
+            Formatted email message
         """
-        # Create multipart message
-        msg = MIMEMultipart()
+        msg = EmailMessage()
         msg['From'] = self.sender_email
         msg['To'] = recipient_email
         msg['Subject'] = self._generate_subject()
 
         # Create email body
         body = self._generate_email_body(question_text)
-        msg.attach(MIMEText(body, 'plain'))
+        msg.set_content(body)
 
         # Attach screenshot if it exists
         if os.path.exists(screenshot_path):
             self._attach_screenshot(msg, screenshot_path)
         else:
-            self.logger.warning(f"Screenshot not found: {screenshot_path}")
+            logger.warning(f"Screenshot not found: {screenshot_path}")
 
         return msg
 
@@ -137,8 +160,7 @@ class EmailNotificationService:
         Returns:
             Formatted subject line with current time
         """
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        return f"iClicker Question Alert - {timestamp}"
+        return _SUBJECT_TEMPLATE.format(timestamp=datetime.now().strftime('%H:%M:%S'))
 
     def _generate_email_body(self, question_text: str) -> str:
         """Generate the email body content for question alerts.
@@ -149,53 +171,115 @@ class EmailNotificationService:
         Returns:
             Formatted email body as a string
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-        return f"""🚨 iClicker Question Detected! 🚨
-
-Time: {timestamp}
-
-Question Content:
-{question_text}
-
-Please see the attached screenshot for the complete question and answer options.
-
-You can respond to this question in your iClicker session.
-
----
-Sent automatically by iClicker Evade
-For support: https://github.com/username/iclicker-evade"""
+        return _BODY_TEMPLATE.format(
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            question_text=question_text
+        )
 
-    def _attach_screenshot(self, msg: MIMEMultipart, screenshot_path: str) -> None:
+    def _attach_screenshot(self, msg: EmailMessage, screenshot_path: str) -> None:
         """Attach a screenshot file to the email message.
 
         Args:
             msg: Email message to attach the screenshot to
-            screenshot_path: Path to the screenshot file
+            screenshot_path: Path to the screenshot file (PNG or WebP)
 
         Raises:
             IOError: If screenshot file cannot be read
         """
+        subtype = os.path.splitext(screenshot_path)[1].lstrip('.').lower() or 'png'
+
         try:
             with open(screenshot_path, 'rb') as f:
-                img_data = f.read()
-
-            image = MIMEImage(img_data)
-            image.add_header(
-                'Content-Disposition',
-                f'attachment; filename={os.path.basename(screenshot_path)}'
-            )
-            msg.attach(image)
+                msg.add_attachment(
+                    f.read(),
+                    maintype='image',
+                    subtype=subtype,
+                    filename=os.path.basename(screenshot_path)
+                )
 
-            self.logger.debug(f"Attached screenshot: {screenshot_path}")
+            logger.debug(f"Attached screenshot: {screenshot_path}")
 
         except IOError as e:
-            self.logger.error(f"Failed to attach screenshot {screenshot_path}: {e}")
+            logger.error(f"Failed to attach screenshot {screenshot_path}: {e}")
+            raise
+
+    def prepare_connection(self) -> None:
+        """Open and authenticate the shared SMTP connection ahead of a send.
+
+        Lets callers overlap the TCP/TLS/AUTH handshake with other work
+        (such as an AI request) before the message itself is ready. A cached
+        connection is probed with NOOP first, since Gmail drops idle sessions
+        long before the next question usually arrives.
+
+        Raises:
+            smtplib.SMTPException: If the connection or login fails
+        """
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    code, _ = self._smtp.noop()
+                except (smtplib.SMTPException, OSError):
+                    code = -1
+                if code != 250:
+                    logger.debug("Cached SMTP connection is stale, reconnecting")
+                    self._reset_smtp()
+            self._get_smtp()
+
+    def close(self) -> None:
+        """Close the shared SMTP connection, if one is open."""
+        with self._smtp_lock:
+            self._reset_smtp()
+
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return the shared SMTP connection, opening it on first use.
+
+        Must be called with ``_smtp_lock`` held.
+
+        Returns:
+            An authenticated SMTP connection
+
+        Raises:
+            smtplib.SMTPException: If the connection or login fails
+        """
+        if self._smtp is None:
+            self._smtp = self._open_smtp()
+            logger.debug("SMTP connection opened")
+        return self._smtp
+
+    def _reset_smtp(self) -> None:
+        """Drop the shared SMTP connection. Must be called with ``_smtp_lock`` held."""
+        server, self._smtp = self._smtp, None
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                server.close()
+
+    def _open_smtp(self) -> smtplib.SMTP:
+        """Connect to Gmail SMTP and authenticate with the app password.
+
+        Returns:
+            An authenticated SMTP connection
+
+        Raises:
+            smtplib.SMTPException: If the connection or login fails
+        """
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.smtp_timeout)
+        try:
+            server.starttls()  # Enable encryption
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
             raise
+        return server
 
-    def _send_via_smtp(self, msg: MIMEMultipart) -> None:
+    def _send_via_smtp(self, msg: EmailMessage) -> None:
         """Send an email message via Gmail SMTP.
 
+        Reuses the shared connection and reconnects once if the server has
+        dropped it or closed the session with a 421. Other SMTP errors are
+        permanent for this message and are raised without a resend.
+
         Args:
             msg: The email message to send
 
@@ -204,49 +288,52 @@ For support: https://github.com/username/iclicker-evade"""
             smtplib.SMTPAuthenticationError: If authentication fails
         """
         try:
-            # Connect to Gmail SMTP server
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()  # Enable encryption
-
-            # Authenticate with app password
-            server.login(self.sender_email, self.sender_password)
-
-            # Send the message
-            server.send_message(msg)
-            server.quit()
-
-            self.logger.debug("Email sent successfully via SMTP")
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    self._reset_smtp()
+                    self._get_smtp().send_message(msg)
+                except smtplib.SMTPResponseException as e:
+                    self._reset_smtp()
+                    # 421: service closing the channel, safe to resend
+                    if e.smtp_code != 421:
+                        raise
+                    self._get_smtp().send_message(msg)
+                except smtplib.SMTPException:
+                    self._reset_smtp()
+                    raise
+
+            logger.debug("Email sent successfully via SMTP")
 
         except smtplib.SMTPAuthenticationError as e:
-            self.logger.error(f"SMTP authentication failed: {e}")
+            logger.error(f"SMTP authentication failed: {e}")
             raise
         except smtplib.SMTPException as e:
-            self.logger.error(f"SMTP error occurred: {e}")
+            logger.error(f"SMTP error occurred: {e}")
             raise
         except Exception as e:
-            self.logger.error(f"Unexpected error during SMTP send: {e}")
+            logger.error(f"Unexpected error during SMTP send: {e}")
             raise
 
     def test_connection(self) -> bool:
         """Test the SMTP connection and authentication.
 
         Attempts to connect to Gmail SMTP and authenticate without
-        sending an email. Useful for validating credentials.
+        sending an email. Useful for validating credentials. A successful
+        connection is kept open for the first alert.
 
         Returns:
             True if connection and authentication successful, False otherwise
         """
         try:
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.sender_email, self.sender_password)
-            server.quit()
+            self.prepare_connection()
 
-            self.logger.info("SMTP connection test successful")
+            logger.info("SMTP connection test successful")
             return True
 
         except Exception as e:
-            self.logger.error(f"SMTP connection test failed: {e}")
+            logger.error(f"SMTP connection test failed: {e}")
             return False
 
 
@@ -264,6 +351,6 @@ def create_email_service(sender_email: Optional[str], sender_password: Optional[
         try:
             return EmailNotificationService(sender_email, sender_password)
         except ValueError as e:
-            logging.error(f"Failed to create email service: {e}")
+            logger.error(f"Failed to create email service: {e}")
             return None
     return None
\ No newline at end of file
@@ -1,7 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import TimeoutException
 import sys
 import os
 
@@ -9,6 +9,46 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from iclicker_signin import navigate_to_university_selection
 
+# Purdue login form fields. A selector list matches whichever alternative
+# appears first in the document, not the first one listed; on the sign-in page
+# both username alternatives resolve to the same input, so the structural one
+# only widens the match. Structural selectors mirror the old absolute XPaths
+# relative to the form fieldset, so wrapper div changes above the form no
+# longer break the lookup
+USERNAME_FIELD_SELECTOR = "input[name='username'], form fieldset > div:nth-of-type(1) > input"
+PASSWORD_FIELD_SELECTOR = "input[type='password']"
+LOGIN_BUTTON_SELECTOR = "form fieldset > div:nth-of-type(3) > button:nth-of-type(2)"
+
+# Fills both login fields and clicks the login button in one round trip.
+# Values go through the native setter and input/change events so framework
+# bindings see them. Returns false without submitting (and with the fields
+# cleared) if an element is missing or the values didn't take.
+FILL_AND_SUBMIT_SCRIPT = """
+    var user = document.querySelector(arguments[0]);
+    var pass = document.querySelector(arguments[1]);
+    var button = document.querySelector(arguments[2]);
+    if (!user || !pass || !button) { return false; }
+    var setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    [[user, arguments[3]], [pass, arguments[4]]].forEach(function (pair) {
+        setValue.call(pair[0], pair[1]);
+        pair[0].dispatchEvent(new Event('input', {bubbles: true}));
+        pair[0].dispatchEvent(new Event('change', {bubbles: true}));
+    });
+    var form = user.form;
+    if (user.value !== arguments[3] || pass.value !== arguments[4]
+            || (form && !form.checkValidity())) {
+        setValue.call(user, '');
+        setValue.call(pass, '');
+        return false;
+    }
+    button.scrollIntoView(true);
+    button.click();
+    return true;
+"""
+
+# Course labels on the class selection page shown after login
+CLASS_LIST_SELECTOR = "app-courses > main > div > ul > li > a > label"
+
 def purdue_login(driver, username, password):
     """Handle Purdue login flow up to getting access code (before class selection)
     
@@ -32,40 +72,41 @@ def purdue_login(driver, username, password):
         print("\n🔐 PURDUE LOGIN")
         print("Looking for username field...")
         username_field = wait.until(
-            EC.presence_of_element_located((By.XPATH, "/html/body/div/main/section/div/div/div/div/div/div/form/fieldset/div[1]/input"))
+            EC.presence_of_element_located((By.CSS_SELECTOR, USERNAME_FIELD_SELECTOR))
         )
         
-        print("Looking for password field...")
-        password_field = wait.until(
-            EC.presence_of_element_located((By.XPATH, "/html/body/div/main/section/div/div/div/div/div/div/form/fieldset/div[2]/input"))
+        print("Entering credentials and logging in...")
+        submitted = driver.execute_script(
+            FILL_AND_SUBMIT_SCRIPT,
+            USERNAME_FIELD_SELECTOR, PASSWORD_FIELD_SELECTOR, LOGIN_BUTTON_SELECTOR,
+            username, password
         )
-        
-        print("Entering username...")
-        username_field.send_keys(username)
-        
-        print("Entering password...")
-        password_field.send_keys(password)
-        
-        print("Looking for login button...")
-        login_button = wait.until(
-            EC.presence_of_element_located((By.XPATH, "/html/body/div/main/section/div/div/div/div/div/div/form/fieldset/div[3]/button[2]"))
-        )
-        
-        print("Scrolling to login button...")
-        driver.execute_script("arguments[0].scrollIntoView(true);", login_button)
-        time.sleep(1)
-        
-        print("Clicking login button...")
-        driver.execute_script("arguments[0].click();", login_button)
-        
-        print("Waiting for page to load...")
-        time.sleep(5)
-        
-    
-        
+
+        if not submitted:
+            # Fall back to typing into the fields if the script could not
+            # find them or the page did not accept the scripted values
+            print("Looking for password field...")
+            password_field = wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PASSWORD_FIELD_SELECTOR))
+            )
+
+            print("Looking for login button...")
+            login_button = wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, LOGIN_BUTTON_SELECTOR))
+            )
+
+            username_field.clear()
+            username_field.send_keys(username)
+            password_field.clear()
+            password_field.send_keys(password)
+
+            print("Clicking login button...")
+            driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", login_button)
+
         print("Looking for access code...")
-        access_code_element = wait.until(
-            EC.presence_of_element_located((By.XPATH, "/html/body/div/div/div[1]/div/div[2]/div[3]"))
+        # Allow extra time for the SSO redirect (and any two-factor prompt)
+        access_code_element = WebDriverWait(driver, 30).until(
+            EC.visibility_of_element_located((By.XPATH, "/html/body/div/div/div[1]/div/div[2]/div[3]"))
         )
         
         access_code = access_code_element.text
@@ -80,7 +121,12 @@ def purdue_login(driver, username, password):
         
         print("Proceeding to class selection...")
 
-        time.sleep(10)
+        try:
+            WebDriverWait(driver, 20).until(
+                EC.visibility_of_element_located((By.CSS_SELECTOR, CLASS_LIST_SELECTOR))
+            )
+        except TimeoutException:
+            print("⚠️  Class list not visible yet, continuing anyway")
         
         return access_code
         
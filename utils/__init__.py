@@ -4,7 +4,24 @@ This package provides common utility functions used throughout
 the application for browser management, validation, and helpers.
 """
 
-from .browser_utils import setup_chrome_driver, safe_quit_driver
+from .browser_utils import (
+    ChromeDriverPool,
+    chrome_session,
+    setup_chrome_driver,
+    setup_chrome_drivers,
+    get_or_create_driver,
+    safe_quit_driver,
+    set_asset_blocking,
+)
 from .validators import validate_email_address
 
-__all__ = ['setup_chrome_driver', 'safe_quit_driver', 'validate_email_address']
\ No newline at end of file
+__all__ = [
+    'ChromeDriverPool',
+    'chrome_session',
+    'setup_chrome_driver',
+    'setup_chrome_drivers',
+    'get_or_create_driver',
+    'safe_quit_driver',
+    'set_asset_blocking',
+    'validate_email_address',
+]
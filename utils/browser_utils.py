@@ -4,15 +4,195 @@ This module provides browser setup and management utilities,
 particularly for Chrome WebDriver configuration.
 """
 
+from __future__ import annotations
+
+import atexit
+import base64
+import copy
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.remote.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# Chrome command-line switches shared by every driver instance
+_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    # iClicker-specific options
+    "--disable-web-security",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-webauthn",
+    # Anti-detection measures
+    "--disable-blink-features=AutomationControlled",
+    # Skip first-run setup and background network traffic at startup
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-client-side-phishing-detection",
+    "--metrics-recording-only",
+    # Set window size for consistent screenshots
+    "--window-size=1920,1080",
+)
+
+# Browser preferences disabling WebAuthn and credential management
+_CHROME_PREFS = {
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "webauthn.virtual_authenticator_enabled": False
+}
+
+# CDP payload hiding WebAuthn so sites can't trigger the native passkey sheet.
+# Kept minified since it is sent over the DevTools channel for every driver.
+_WEBAUTHN_DISABLE_PAYLOAD = {
+    "source": (
+        "(()=>{"
+        "try{Object.defineProperty(window,'PublicKeyCredential',{value:undefined});}catch(e){}"
+        "const shim={"
+        "get:()=>Promise.reject(new DOMException('NotAllowedError','NotAllowedError')),"
+        "create:()=>Promise.reject(new DOMException('NotAllowedError','NotAllowedError')),"
+        "preventSilentAccess:()=>Promise.resolve()"
+        "};"
+        "try{Object.defineProperty(navigator,'credentials',{get(){return shim;}});}catch(e){}"
+        "})();"
+    )
+}
+
+# Asset URL patterns blocked during sign-in, where only the DOM is needed.
+# Fonts and SVG icons stay allowed: the browser does not re-fetch them once
+# blocking is lifted, so later screenshots would render without them
+_BLOCKED_ASSET_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.mp4", "*.webm",
+]
+
+# Implicit wait used during sign-in, kept short since the sign-in flow uses
+# explicit waits; the question monitor sets it to 0
+_IMPLICIT_WAIT_SECONDS = 2
+
+
+def set_asset_blocking(driver: WebDriver, enabled: bool) -> None:
+    """Turn blocking of images and media on or off for a driver.
+
+    Blocking cuts page-load time when only the DOM matters, but must be
+    off whenever the page is screenshotted or shown to the user.
+
+    Args:
+        driver: Chrome WebDriver instance
+        enabled: Whether asset requests should be blocked
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": _BLOCKED_ASSET_URLS if enabled else []}
+        )
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Could not update asset blocking: {e}")
+
+
+# Origins whose web storage is wiped when a driver is reset for reuse;
+# iClicker keeps its session in storage rather than cookies
+_SESSION_STORAGE_ORIGINS = ("https://student.iclicker.com",)
 
 
-def setup_chrome_driver(headless: bool = True) -> WebDriver:
+def _clear_browser_session(driver: WebDriver) -> None:
+    """Remove every cookie and the iClicker web storage from a driver.
+
+    ``delete_all_cookies`` only covers the current document's domain, so
+    SSO cookies would survive; the CDP commands clear the whole profile.
+
+    Args:
+        driver: Chrome WebDriver instance to reset
+
+    Raises:
+        WebDriverException: If the browser rejects a CDP command
+    """
+    # Session storage is per tab and not covered by Storage.clearDataForOrigin
+    origins = set(_SESSION_STORAGE_ORIGINS)
+    current_origin = driver.execute_script(
+        "try{window.sessionStorage.clear();}catch(e){} return window.location.origin;"
+    )
+    if isinstance(current_origin, str) and current_origin.startswith("http"):
+        origins.add(current_origin)
+
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    for origin in origins:
+        driver.execute_cdp_cmd(
+            "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+        )
+
+
+# Fully configured Chrome options per headless mode, built on first use;
+# the lock keeps concurrent pool startup from building a template twice
+_options_templates: Dict[bool, Options] = {}
+_options_templates_lock = threading.Lock()
+
+
+def _get_options_template(headless: bool) -> Options:
+    """Return the shared Chrome options template for a headless mode.
+
+    Args:
+        headless: Whether the options should run Chrome in headless mode
+
+    Returns:
+        Configured Options instance; callers must deep-copy it before use
+    """
+    template = _options_templates.get(headless)
+    if template is not None:
+        return template
+
+    with _options_templates_lock:
+        template = _options_templates.get(headless)
+        if template is None:
+            template = _build_options_template(headless)
+            _options_templates[headless] = template
+    return template
+
+
+def _build_options_template(headless: bool) -> Options:
+    """Build the Chrome options for a headless mode.
+
+    Args:
+        headless: Whether the options should run Chrome in headless mode
+
+    Returns:
+        Newly configured Options instance
+    """
+    from selenium.webdriver.chrome.options import Options
+
+    # Configure Chrome options for iClicker compatibility
+    template = Options()
+    for argument in _CHROME_ARGS:
+        template.add_argument(argument)
+
+    if headless:
+        template.add_argument("--headless=new")
+
+    # Return from navigation at DOMContentLoaded instead of window load;
+    # every flow waits explicitly for the elements it needs
+    template.page_load_strategy = "eager"
+
+    # Anti-detection measures
+    template.add_experimental_option("useAutomationExtension", False)
+    template.add_experimental_option("excludeSwitches", ["enable-automation"])
+
+    # Disable WebAuthn and credential management
+    template.add_experimental_option("prefs", _CHROME_PREFS)
+
+    return template
+
+
+def setup_chrome_driver(headless: bool = True, block_assets: bool = True) -> WebDriver:
     """Set up and configure a Chrome WebDriver instance with iClicker-specific settings.
 
     Creates a Chrome WebDriver optimized for iClicker automation, including
@@ -20,6 +200,8 @@ def setup_chrome_driver(headless: bool = True) -> WebDriver:
 
     Args:
         headless: Whether to run Chrome in headless mode (no GUI)
+        block_assets: Whether to block image and media downloads;
+            disable when pages will be screenshotted
 
     Returns:
         Configured Chrome WebDriver instance
@@ -32,66 +214,42 @@ def setup_chrome_driver(headless: bool = True) -> WebDriver:
         >>> driver.get("https://student.iclicker.com")
         >>> driver.quit()
     """
+    # Imported lazily so CLI paths that never start a browser skip selenium
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
     logger = logging.getLogger(__name__)
 
     try:
-        # Configure Chrome options for iClicker compatibility
-        chrome_options = Options()
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-
-        if headless:
-            chrome_options.add_argument("--headless")
-
-        # iClicker-specific options
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-webauthn")
-
-        # Anti-detection measures
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-
-        # Disable WebAuthn and credential management
-        chrome_options.add_experimental_option("prefs", {
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False,
-            "webauthn.virtual_authenticator_enabled": False
-        })
-
-        # Set window size for consistent screenshots
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        # Automatically manage ChromeDriver installation
+        # Deep copy: Options keeps its arguments, experimental options and
+        # capabilities in mutable containers that a shallow copy would share
+        chrome_options = copy.deepcopy(_get_options_template(headless))
+
+        # Prefer an explicit ChromeDriver; otherwise Selenium Manager resolves
+        # and caches one matching the installed Chrome
+        driver_path = os.environ.get("CHROMEDRIVER_PATH")
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(driver_path) if driver_path else Service()
             driver = webdriver.Chrome(service=service, options=chrome_options)
         except Exception:
-            # Fallback to system ChromeDriver if webdriver-manager fails
-            logger.warning("ChromeDriverManager failed, using system ChromeDriver")
-            driver = webdriver.Chrome(options=chrome_options)
+            # An explicit path is authoritative; otherwise fall back to a
+            # chromedriver on PATH rather than repeating Selenium Manager
+            system_driver = None if driver_path else shutil.which("chromedriver")
+            if system_driver is None:
+                raise
+            logger.warning(f"ChromeDriver resolution failed, using {system_driver}")
+            driver = webdriver.Chrome(service=Service(system_driver), options=chrome_options)
 
         # Add script to disable WebAuthn APIs before navigating
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": r"""
-            (() => {
-                // Hide WebAuthn so sites can't trigger the native passkey sheet
-                try { Object.defineProperty(window, 'PublicKeyCredential', { value: undefined }); } catch(e) {}
-                const shim = {
-                    get: () => Promise.reject(new DOMException('NotAllowedError', 'NotAllowedError')),
-                    create: () => Promise.reject(new DOMException('NotAllowedError', 'NotAllowedError')),
-                    preventSilentAccess: () => Promise.resolve(),
-                };
-                try { Object.defineProperty(navigator, 'credentials', { get() { return shim; } }); } catch(e) {}
-            })();
-            """
-        })
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", _WEBAUTHN_DISABLE_PAYLOAD
+        )
+
+        if block_assets:
+            set_asset_blocking(driver, True)
 
         # Set timeouts
-        driver.implicitly_wait(10)
+        driver.implicitly_wait(_IMPLICIT_WAIT_SECONDS)
         driver.set_page_load_timeout(30)
 
         logger.info(f"Chrome WebDriver initialized with iClicker settings (headless={headless})")
@@ -102,30 +260,285 @@ def setup_chrome_driver(headless: bool = True) -> WebDriver:
         raise RuntimeError(f"WebDriver setup failed: {e}") from e
 
 
-def safe_quit_driver(driver: WebDriver) -> None:
+def setup_chrome_drivers(count: int, headless: bool = True, block_assets: bool = True) -> List[WebDriver]:
+    """Launch several Chrome WebDrivers in parallel.
+
+    Chrome startup is dominated by process spawn and the driver handshake,
+    so launching on threads takes roughly as long as the slowest single
+    launch instead of the sum of all of them.
+
+    Args:
+        count: Number of drivers to launch
+        headless: Whether to run Chrome in headless mode (no GUI)
+        block_assets: Whether to block image and media downloads
+
+    Returns:
+        List of configured Chrome WebDriver instances
+
+    Raises:
+        ValueError: If count is less than 1
+        RuntimeError: If any driver fails to launch (the others are quit)
+    """
+    if count < 1:
+        raise ValueError("Driver count must be at least 1")
+
+    with ThreadPoolExecutor(max_workers=count, thread_name_prefix="chrome-setup") as executor:
+        futures = [
+            executor.submit(setup_chrome_driver, headless, block_assets)
+            for _ in range(count)
+        ]
+
+    drivers = [future.result() for future in futures if future.exception() is None]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    if errors:
+        for driver in drivers:
+            safe_quit_driver(driver)
+        raise RuntimeError(f"Failed to launch {len(errors)} of {count} WebDrivers: {errors[0]}") from errors[0]
+
+    return drivers
+
+
+# Process-wide driver reused across sign-in attempts
+_cached_driver: Optional[WebDriver] = None
+_cached_driver_headless: Optional[bool] = None
+
+
+def get_or_create_driver(headless: bool = True) -> WebDriver:
+    """Return the shared Chrome WebDriver, creating it on first use.
+
+    Reusing the driver avoids a full Chrome launch for every sign-in
+    attempt. On reuse, browser cookies are cleared so each attempt starts
+    from a logged-out state. A new driver is created if the cached one
+    has died or was started with a different headless setting.
+
+    Args:
+        headless: Whether to run Chrome in headless mode (no GUI)
+
+    Returns:
+        Shared Chrome WebDriver instance
+
+    Raises:
+        RuntimeError: If a new WebDriver cannot be set up
+    """
+    global _cached_driver, _cached_driver_headless
+    logger = logging.getLogger(__name__)
+
+    if _cached_driver is not None and _cached_driver_headless == headless:
+        try:
+            _clear_browser_session(_cached_driver)
+            # The question monitor drops the implicit wait and asset
+            # blocking; restore both for login
+            _cached_driver.implicitly_wait(_IMPLICIT_WAIT_SECONDS)
+            set_asset_blocking(_cached_driver, True)
+            logger.debug("Reusing cached Chrome WebDriver")
+            return _cached_driver
+        except Exception as e:
+            logger.warning(f"Cached WebDriver unusable, creating a new one: {e}")
+            safe_quit_driver(_cached_driver)
+    elif _cached_driver is not None:
+        safe_quit_driver(_cached_driver)
+
+    _cached_driver = setup_chrome_driver(headless=headless)
+    _cached_driver_headless = headless
+    return _cached_driver
+
+
+class ChromeDriverPool:
+    """Pool of warm Chrome WebDrivers reused across browser sessions.
+
+    Launching Chrome takes seconds, while resetting an existing browser
+    takes a fraction of that. Drivers handed back with ``release`` are
+    reset to a blank, logged-out state and kept idle for the next
+    ``acquire`` with the same headless setting. Idle drivers are quit at
+    interpreter exit.
+
+    Attributes:
+        max_idle (int): Maximum number of idle drivers kept per headless mode
+    """
+
+    def __init__(self, max_idle: int = 2) -> None:
+        """Initialize an empty driver pool.
+
+        Args:
+            max_idle: Maximum number of idle drivers kept per headless mode
+        """
+        self.max_idle = max_idle
+        self._idle: Dict[bool, List[WebDriver]] = {True: [], False: []}
+        self._headless: Dict[int, bool] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def acquire(self, headless: bool = True) -> WebDriver:
+        """Return an idle driver, launching a new one if none is available.
+
+        Args:
+            headless: Whether the driver should run Chrome in headless mode
+
+        Returns:
+            Chrome WebDriver instance owned by the caller until released
+
+        Raises:
+            RuntimeError: If a new WebDriver cannot be set up
+        """
+        with self._lock:
+            driver = self._idle[headless].pop() if self._idle[headless] else None
+
+        if driver is None:
+            driver = setup_chrome_driver(headless=headless)
+        else:
+            logging.getLogger(__name__).debug("Reusing pooled Chrome WebDriver")
+
+        with self._lock:
+            self._headless[id(driver)] = headless
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """Reset a driver and return it to the pool.
+
+        Drivers that fail to reset, were not acquired from this pool, or
+        would exceed ``max_idle`` are quit instead.
+
+        Args:
+            driver: Driver previously returned by ``acquire``
+        """
+        logger = logging.getLogger(__name__)
+
+        with self._lock:
+            headless = self._headless.pop(id(driver), None)
+
+        if headless is None:
+            safe_quit_driver(driver)
+            return
+
+        try:
+            _clear_browser_session(driver)
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            driver.get("about:blank")
+            driver.implicitly_wait(_IMPLICIT_WAIT_SECONDS)
+            set_asset_blocking(driver, True)
+        except Exception as e:
+            logger.warning(f"Pooled WebDriver failed to reset, quitting it: {e}")
+            safe_quit_driver(driver)
+            return
+
+        with self._lock:
+            if len(self._idle[headless]) < self.max_idle:
+                self._idle[headless].append(driver)
+                return
+
+        safe_quit_driver(driver)
+
+    def shutdown(self) -> None:
+        """Quit every idle driver held by the pool."""
+        with self._lock:
+            drivers = self._idle[True] + self._idle[False]
+            self._idle = {True: [], False: []}
+
+        for driver in drivers:
+            safe_quit_driver(driver)
+
+
+# Background teardown threads still running, joined at interpreter exit so
+# Chrome processes are not orphaned when the daemon threads are killed
+_pending_quits: List[threading.Thread] = []
+
+
+def _join_pending_quits() -> None:
+    """Wait for background driver teardowns started by ``safe_quit_driver``."""
+    for thread in list(_pending_quits):
+        thread.join()
+
+
+atexit.register(_join_pending_quits)
+
+
+def safe_quit_driver(
+    driver: WebDriver,
+    pool: Optional[ChromeDriverPool] = None,
+    background: bool = False
+) -> None:
     """Safely quit a WebDriver instance.
 
     Attempts to close the browser gracefully, handling any exceptions
     that might occur during cleanup.
 
+    Args:
+        driver: WebDriver instance to quit
+        pool: Pool the driver was acquired from; if given, the driver is
+            released back to it instead of being quit
+        background: Quit on a daemon thread and return immediately instead
+            of blocking while Chrome shuts down
+    """
+    global _cached_driver, _cached_driver_headless
+
+    if pool is not None and driver is not None:
+        pool.release(driver)
+        return
+
+    if driver is not None and driver is _cached_driver:
+        _cached_driver = None
+        _cached_driver_headless = None
+
+    if not driver:
+        return
+
+    if background:
+        thread = threading.Thread(target=_quit_driver, args=(driver,), name="chrome-quit", daemon=True)
+        _pending_quits.append(thread)
+        thread.start()
+    else:
+        _quit_driver(driver)
+
+
+def _quit_driver(driver: WebDriver) -> None:
+    """Quit a driver, logging instead of raising on failure.
+
     Args:
         driver: WebDriver instance to quit
     """
     logger = logging.getLogger(__name__)
 
     try:
-        if driver:
-            driver.quit()
-            logger.info("WebDriver closed successfully")
+        driver.quit()
+        logger.info("WebDriver closed successfully")
     except Exception as e:
         logger.warning(f"Error closing WebDriver: {e}")
+    finally:
+        current = threading.current_thread()
+        if current in _pending_quits:
+            _pending_quits.remove(current)
+
+
+@contextmanager
+def chrome_session(headless: bool = True, pool: Optional[ChromeDriverPool] = None) -> Iterator[WebDriver]:
+    """Provide a Chrome WebDriver that is always released or quit afterwards.
+
+    Args:
+        headless: Whether to run Chrome in headless mode (no GUI)
+        pool: Optional pool to acquire the driver from and release it to
+
+    Yields:
+        Chrome WebDriver instance for the duration of the ``with`` block
+
+    Raises:
+        RuntimeError: If a new WebDriver cannot be set up
+
+    Example:
+        >>> with chrome_session(headless=True) as driver:
+        ...     driver.get("https://student.iclicker.com")
+    """
+    driver = pool.acquire(headless) if pool is not None else setup_chrome_driver(headless=headless)
+    try:
+        yield driver
+    finally:
+        safe_quit_driver(driver, pool=pool)
 
 
 def take_full_page_screenshot(driver: WebDriver, filepath: str) -> bool:
     """Take a full-page screenshot of the current page.
 
-    Resizes the browser window to capture the entire page content,
-    then restores the original window size.
+    Uses the Chrome DevTools Protocol to render the entire page beyond the
+    viewport in a single call, without resizing the browser window.
 
     Args:
         driver: WebDriver instance
@@ -137,38 +550,17 @@ def take_full_page_screenshot(driver: WebDriver, filepath: str) -> bool:
     logger = logging.getLogger(__name__)
 
     try:
-        # Save current window size
-        original_size = driver.get_window_size()
-
-        # Calculate total page height
-        total_height = driver.execute_script(
-            "return Math.max("
-            "document.body.scrollHeight, document.body.offsetHeight, "
-            "document.documentElement.clientHeight, "
-            "document.documentElement.scrollHeight, "
-            "document.documentElement.offsetHeight"
-            ");"
+        result = driver.execute_cdp_cmd(
+            "Page.captureScreenshot",
+            {"format": "png", "captureBeyondViewport": True, "fromSurface": True}
         )
 
-        # Set window size to capture full page
-        driver.set_window_size(original_size['width'], total_height)
-
-        # Scroll to top
-        driver.execute_script("window.scrollTo(0, 0);")
-
-        # Take screenshot
-        success = driver.save_screenshot(filepath)
-
-        # Restore original window size
-        driver.set_window_size(original_size['width'], original_size['height'])
-
-        if success:
-            logger.debug(f"Full page screenshot saved: {filepath}")
-        else:
-            logger.warning(f"Screenshot may have failed: {filepath}")
+        with open(filepath, "wb") as f:
+            f.write(base64.b64decode(result["data"]))
 
-        return success
+        logger.debug(f"Full page screenshot saved: {filepath}")
+        return True
 
     except Exception as e:
         logger.error(f"Failed to take full page screenshot: {e}")
-        return False
\ No newline at end of file
+        return False
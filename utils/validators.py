@@ -5,9 +5,18 @@ configuration values, and data integrity checks.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
+# Patterns compiled once at import instead of looked up in re's cache per call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_CLASSNAME_RE = re.compile(r'^[a-zA-Z0-9\s\-_.,()]+$')
+
+# Characters not allowed in filenames, each mapped to an underscore
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
 def validate_email_address(email: str) -> bool:
     """Validate an email address format.
 
@@ -29,9 +38,28 @@ def validate_email_address(email: str) -> bool:
     if not email or not isinstance(email, str):
         return False
 
-    # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _is_valid_email(email)
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_email(email: str) -> bool:
+    """Check a non-empty string against the email format (memoized).
+
+    Only called with strings, so the cache never sees unhashable arguments.
+
+    Args:
+        email: Email address string to validate
+
+    Returns:
+        True if email format is valid, False otherwise
+    """
+    # Skip the regex entirely for strings that can't be an address: exactly
+    # one '@', with a non-empty local part and a dot somewhere after it
+    at = email.find('@')
+    if at <= 0 or at == len(email) - 1 or email.find('@', at + 1) != -1 or email.find('.', at) == -1:
+        return False
+
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_polling_interval(interval: int) -> bool:
@@ -46,7 +74,8 @@ def validate_polling_interval(interval: int) -> bool:
     Returns:
         True if interval is valid, False otherwise
     """
-    return isinstance(interval, int) and 1 <= interval <= 300
+    # Exact type check: rejects bool (an int subclass) without an MRO walk
+    return type(interval) is int and 1 <= interval <= 300
 
 
 def validate_class_name(class_name: Optional[str]) -> bool:
@@ -67,13 +96,27 @@ def validate_class_name(class_name: Optional[str]) -> bool:
     if not isinstance(class_name, str):
         return False
 
+    return _is_valid_class_name(class_name)
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_class_name(class_name: str) -> bool:
+    """Check a class name string's length and characters (memoized).
+
+    Args:
+        class_name: Class name to validate
+
+    Returns:
+        True if class name is valid, False otherwise
+    """
+    stripped = class_name.strip()
+
     # Class name should be 1-100 characters
-    if not (1 <= len(class_name.strip()) <= 100):
+    if not (1 <= len(stripped) <= 100):
         return False
 
     # Should contain mostly alphanumeric and common punctuation
-    pattern = r'^[a-zA-Z0-9\s\-_.,()]+$'
-    return bool(re.match(pattern, class_name.strip()))
+    return bool(_CLASSNAME_RE.match(stripped))
 
 
 def sanitize_filename(filename: str) -> str:
@@ -91,15 +134,7 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         return "unnamed_file"
 
-    # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-
-    # Remove leading/trailing whitespace and dots
-    sanitized = sanitized.strip('. ')
-
-    # Ensure filename is not empty after sanitization
-    if not sanitized:
-        return "unnamed_file"
-
-    # Limit length to 255 characters (common filesystem limit)
-    return sanitized[:255]
\ No newline at end of file
+    # Replace invalid characters, trim leading/trailing whitespace and dots,
+    # and limit to 255 characters (common filesystem limit); fall back to a
+    # placeholder if nothing is left
+    return filename.translate(_SANITIZE_TABLE).strip('. ')[:255] or "unnamed_file"